@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
+import hashlib
 import itertools
+import json
 import os
 import platform
 import shutil
@@ -10,6 +12,7 @@ import sysconfig
 from pathlib import Path
 
 import numpy as np
+from Cython import __version__ as cython_version
 from Cython.Build import build_ext
 from Cython.Build import cythonize
 from Cython.Compiler import Options
@@ -24,6 +27,10 @@ IS_WINDOWS = platform.system() == "Windows"
 IS_ARM64 = platform.machine() in ("arm64", "aarch64")
 
 BUILD_MODE = os.getenv("BUILD_MODE", "release")
+# `pgo` is a release build in two stages: instrument, profile the test suite, rebuild
+IS_RELEASE = BUILD_MODE in ("release", "pgo")
+# Tune for the build host's ISA; set NATIVE_ARCH=0 to target the platform baseline
+NATIVE_ARCH = os.getenv("NATIVE_ARCH", "1") == "1"
 os.environ.setdefault("RUSTUP_TOOLCHAIN", "1.93.0")
 os.environ.setdefault("PYO3_PYTHON", sys.executable)
 
@@ -38,6 +45,22 @@ if IS_LINUX:
         os.environ.setdefault("CXX", "clang++")
         os.environ["LDSHARED"] = "clang -shared"
 
+if (IS_LINUX or IS_MACOS) and shutil.which("ccache"):
+    if IS_MACOS:
+        os.environ.setdefault("CC", "clang")
+        os.environ.setdefault("CXX", "clang++")
+    # Wrap whichever compilers are configured, leaving user-chosen ones in place
+    for var in ("CC", "CXX", "LDSHARED"):
+        value = os.environ.get(var)
+        if value and not value.startswith("ccache"):
+            os.environ[var] = f"ccache {value}"
+
+if os.environ.get("CC", "").startswith("ccache"):
+    # Cython regenerates C files with fresh mtimes but identical content, so hash by
+    # content rather than timestamps. Set CCACHE_DIR to persist the cache (e.g. in CI).
+    os.environ.setdefault("CCACHE_SLOPPINESS", "time_macros,file_macro,include_file_mtime")
+    os.environ.setdefault("CCACHE_COMPILERCHECK", "content")
+
 if IS_WINDOWS:
     RUST_LIB_PFX = ""
     RUST_STATIC_LIB_EXT = "lib"
@@ -52,7 +75,7 @@ else:
     RUST_DYLIB_EXT = "so"
 
 CARGO_TARGET_DIR = os.environ.get("CARGO_TARGET_DIR", Path.cwd() / "target")
-profile_dir = "release" if BUILD_MODE == "release" else "debug"
+profile_dir = "release" if IS_RELEASE else "debug"
 CARGO_TARGET_DIR = Path(CARGO_TARGET_DIR) / profile_dir
 
 RUST_INCLUDES = ["nexuscore/core/includes"]
@@ -62,14 +85,53 @@ RUST_LIB_PATHS = [
     CARGO_TARGET_DIR / f"{RUST_LIB_PFX}nautilus_model.{RUST_STATIC_LIB_EXT}",
 ]
 RUST_LIBS = [str(path) for path in RUST_LIB_PATHS]
+RUST_PYO3_LIB_PATH = CARGO_TARGET_DIR / f"{RUST_LIB_PFX}nexuscore_pyo3.{RUST_DYLIB_EXT}"
+# Environment which changes the Rust artifacts or generated bindings without touching any source
+RUST_ENV_VARS = ("HIGH_PRECISION", "RUSTFLAGS", "RUSTUP_TOOLCHAIN", "PYO3_PYTHON")
+RUST_LIBS_ENV_RECORD = CARGO_TARGET_DIR / ".nexuscore_libs_env.json"
+RUST_PYO3_ENV_RECORD = CARGO_TARGET_DIR / ".nexuscore_pyo3_env.json"
+# Shared by both cargo invocations. User settings win, and job count is left to cargo's
+# own default, which (unlike `os.cpu_count()`) respects cgroup CPU quotas.
+CARGO_ENV = {
+    "CARGO_INCREMENTAL": "0" if IS_RELEASE else "1",
+    **os.environ,
+}
 
 ################################################################################
 #  RUST BUILD
 ################################################################################
 
-def _build_rust_libs():
+def _rust_env_fingerprint(env):
+    return json.dumps({var: env.get(var, "") for var in RUST_ENV_VARS}, sort_keys=True)
+
+
+def _record_rust_env(env_record, env):
+    env_record.write_text(_rust_env_fingerprint(env))
+
+
+def _rust_artifacts_up_to_date(artifacts, env_record, env):
+    # Skips spawning cargo when the artifacts were built under the same environment and
+    # no Rust source or manifest is newer than them
+    try:
+        if env_record.read_text() != _rust_env_fingerprint(env):
+            return False
+        built_mtime = min(path.stat().st_mtime for path in artifacts)
+    except FileNotFoundError:
+        return False
+    sources = itertools.chain(
+        Path("crates").rglob("*.rs"),
+        Path("crates").rglob("*.toml"),
+        (path for path in map(Path, ("Cargo.toml", "Cargo.lock", "rust-toolchain.toml")) if path.exists()),
+    )
+    return all(src.stat().st_mtime < built_mtime for src in sources)
+
+
+def _build_rust_libs(force=False):
+    if not force and _rust_artifacts_up_to_date(RUST_LIB_PATHS, RUST_LIBS_ENV_RECORD, CARGO_ENV):
+        print("Rust static libraries are up to date")
+        return
     print("Compiling Rust static libraries...")
-    build_options = ["--release"] if BUILD_MODE == "release" else []
+    build_options = ["--release"] if IS_RELEASE else []
 
     # Build static libraries with FFI
     cmd_args = [
@@ -82,9 +144,27 @@ def _build_rust_libs():
         "--features", "ffi,extension-module",
     ]
     print(" ".join(cmd_args))
-    subprocess.run(cmd_args, check=True)
+    subprocess.run(cmd_args, check=True, env=CARGO_ENV)
+    _record_rust_env(RUST_LIBS_ENV_RECORD, CARGO_ENV)
+
+
+def _rust_pyo3_env():
+    if not IS_MACOS:
+        return CARGO_ENV
+    extra = "-C link-arg=-undefined -C link-arg=dynamic_lookup"
+    return {**CARGO_ENV, "RUSTFLAGS": f"{CARGO_ENV.get('RUSTFLAGS', '')} {extra}".strip()}
+
+
+def _start_rust_pyo3_build(force=False):
+    # Returns the running cargo process (or None when up to date) so the caller can
+    # overlap it with the Cython build and wait on it afterwards
+    pyo3_env = _rust_pyo3_env()
+    if not force and _rust_artifacts_up_to_date([RUST_PYO3_LIB_PATH], RUST_PYO3_ENV_RECORD, pyo3_env):
+        print("Rust PyO3 extension is up to date")
+        return None
+    print("Compiling Rust PyO3 extension...")
+    build_options = ["--release"] if IS_RELEASE else []
 
-    # Build PyO3 cdylib
     pyo3_cmd = [
         "cargo", "build", "--lib",
         "-p", "nexuscore-pyo3",
@@ -92,18 +172,34 @@ def _build_rust_libs():
         "--features", "extension-module",
     ]
     print(" ".join(pyo3_cmd))
-    pyo3_env = os.environ.copy()
-    pyo3_env.setdefault("PYO3_PYTHON", sys.executable)
-    if IS_MACOS:
-        extra = "-C link-arg=-undefined -C link-arg=dynamic_lookup"
-        pyo3_env["RUSTFLAGS"] = f"{pyo3_env.get('RUSTFLAGS', '')} {extra}".strip()
-    subprocess.run(pyo3_cmd, check=True, env=pyo3_env)
+    return subprocess.Popen(pyo3_cmd, env=pyo3_env)
+
+
+def _wait_rust_pyo3_build(process):
+    if process is None:
+        return
+    returncode = process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, process.args)
+    _record_rust_env(RUST_PYO3_ENV_RECORD, _rust_pyo3_env())
+
+
+def _link_or_copy(src, dst):
+    # Hardlinks avoid copying the binary; fall back when crossing devices. Only use this for
+    # throwaway build outputs, since stripping the source tree copy rewrites the linked file.
+    dst = Path(dst)
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src=src, dst=dst)
 
 
 def _copy_rust_dylibs():
     ext_suffix = sysconfig.get_config_var("EXT_SUFFIX")
-    src = Path(CARGO_TARGET_DIR) / f"{RUST_LIB_PFX}nexuscore_pyo3.{RUST_DYLIB_EXT}"
+    src = RUST_PYO3_LIB_PATH
     dst = Path("nexuscore") / f"_nexuscore_pyo3{ext_suffix}"
+    # Copied rather than linked so stripping never modifies cargo's own artifact
     shutil.copyfile(src=src, dst=dst)
     print(f"Copied {src} to {dst}")
 
@@ -112,30 +208,158 @@ def _copy_rust_dylibs():
 #  CYTHON BUILD
 ################################################################################
 
-Options.docstrings = True
+# Docstrings are dropped from release binaries to shrink the modules; the .pyi stubs remain
+Options.docstrings = not IS_RELEASE
+Options.embed_pos_in_docstring = False
 Options.fast_fail = True
 
+CYTHON_CACHE_ROOT = Path("build/cython_cache")
+
 CYTHON_COMPILER_DIRECTIVES = {
     "language_level": "3",
     "cdivision": True,
     "nonecheck": True,
-    "embedsignature": True,
+    # Bounds and negative-index checks stay on globally; hot paths opt out per function
+    # with `@cython.boundscheck(False)` / `@cython.wraparound(False)` (e.g. `publish_c`)
+    "initializedcheck": False,
+    "overflowcheck": False,
+    "embedsignature": not IS_RELEASE,
     "profile": False,
     "linetrace": False,
     "warn.maybe_uninitialized": True,
 }
 
 
-def _build_extensions():
+def _cython_cache_dir():
+    # The cythonize cache keys only on the source, not on directives or global options,
+    # so generated C is cached separately per configuration
+    config = json.dumps(
+        {
+            "build_mode": BUILD_MODE,
+            "directives": CYTHON_COMPILER_DIRECTIVES,
+            "docstrings": Options.docstrings,
+            "embed_pos_in_docstring": Options.embed_pos_in_docstring,
+        },
+        sort_keys=True,
+    )
+    return CYTHON_CACHE_ROOT / hashlib.blake2b(config.encode(), digest_size=8).hexdigest()
+
+
+PYX_MANIFEST_PATH = Path("build/pyx_manifest.json")
+WALK_SKIP_DIRS = {"build", "target", "__pycache__", ".git", ".venv"}
+
+
+def _walk_files(root, suffixes):
+    files = []
+    dir_mtimes = {}
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in WALK_SKIP_DIRS and not entry.name.startswith("."):
+                        stack.append(entry.path)
+                elif entry.name.endswith(suffixes):
+                    files.append(entry.path)
+    return sorted(files), dir_mtimes
+
+
+def _list_files(root, suffixes, manifest_path):
+    # A directory's mtime changes whenever an entry is added or removed, so the cached
+    # listing stays valid while every walked directory keeps its recorded mtime
+    try:
+        manifest = json.loads(manifest_path.read_text())
+        if all(os.stat(path).st_mtime_ns == mtime for path, mtime in manifest["dirs"].items()):
+            return manifest["files"]
+    except (OSError, KeyError, ValueError):
+        pass
+
+    files, dir_mtimes = _walk_files(root, suffixes)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps({"dirs": dir_mtimes, "files": files}))
+    return files
+
+
+def _find_pyx_files():
+    return [Path(pyx) for pyx in _list_files("nexuscore", (".pyx",), PYX_MANIFEST_PATH)]
+
+
+def _is_clang():
+    cc = os.environ.get("CC") or sysconfig.get_config_var("CC") or ""
+    return IS_MACOS or "clang" in cc
+
+
+def _arch_args():
+    # Wheels are tagged for the baseline ISA, so only target the host CPU when asked
+    if not NATIVE_ARCH:
+        return []
+    # Apple clang and GCC on aarch64 spell the native CPU target as `-mcpu`
+    return ["-mcpu=native"] if IS_ARM64 else ["-march=native"]
+
+
+def _fast_linker():
+    # macOS already ships a fast linker. On Linux each linker must also be able to read
+    # the compiler's LTO objects: lld for clang bitcode, mold (via the plugin) for GCC.
+    if not IS_LINUX:
+        return None
+    if _is_clang():
+        return "lld" if shutil.which("ld.lld") else None
+    return "mold" if shutil.which("mold") else None
+
+
+def _lto_args():
+    if not _is_clang():
+        return ["-flto=auto"]
+    if IS_LINUX and _fast_linker() != "lld":
+        # ThinLTO needs an LLVM-aware linker; the system BFD linker cannot read bitcode
+        return []
+    return ["-flto=thin"]
+
+
+PGO_DIR = Path("build/pgo").resolve()
+PGO_PROFDATA_PATH = PGO_DIR / "merged.profdata"
+
+
+def _pgo_args(pgo_stage):
+    if pgo_stage == "generate":
+        return [f"-fprofile-generate={PGO_DIR}"]
+    if pgo_stage == "use":
+        if _is_clang():
+            return [f"-fprofile-use={PGO_PROFDATA_PATH}"]
+        return [f"-fprofile-use={PGO_DIR}", "-fprofile-correction"]
+    return []
+
+
+def _build_extensions(pgo_stage=None):
     define_macros = [("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")]
     extra_compile_args = []
     extra_link_args = list(RUST_LIBS)
 
     if not IS_WINDOWS:
         extra_compile_args.append("-Wno-unreachable-code")
-        if BUILD_MODE == "release":
-            extra_compile_args.append("-O2")
+        linker = _fast_linker()
+        if linker:
+            extra_link_args.append(f"-fuse-ld={linker}")
+        if IS_RELEASE:
+            extra_compile_args.append("-O3")
             extra_compile_args.append("-pipe")
+            # Only `PyInit_*` (marked visible by `PyMODINIT_FUNC`) needs exporting
+            extra_compile_args.append("-fvisibility=hidden")
+            if IS_LINUX:
+                extra_compile_args.append("-fno-plt")
+                # Let the linker drop unreferenced functions and data from each module
+                extra_compile_args.append("-ffunction-sections")
+                extra_compile_args.append("-fdata-sections")
+                extra_link_args.append("-Wl,--gc-sections")
+            extra_compile_args.extend(_arch_args())
+            lto_args = _lto_args()
+            extra_compile_args.extend(lto_args)
+            extra_link_args.extend(lto_args)
+            pgo_args = _pgo_args(pgo_stage)
+            extra_compile_args.extend(pgo_args)
+            extra_link_args.extend(pgo_args)
 
     print("Creating C extension modules...")
     return [
@@ -148,21 +372,31 @@ def _build_extensions():
             extra_link_args=extra_link_args,
             extra_compile_args=extra_compile_args,
         )
-        for pyx in Path("nexuscore").rglob("*.pyx")
+        for pyx in _find_pyx_files()
     ]
 
 
+def _cythonize_extensions(extensions, force=False):
+    print("Translating Cython modules to C...")
+    nthreads = min(os.cpu_count() or 1, max(len(extensions), 1))
+    cache_dir = _cython_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cythonize(
+        module_list=extensions,
+        compiler_directives=CYTHON_COMPILER_DIRECTIVES,
+        nthreads=nthreads,
+        # Generated C depends on the mode (docstrings, signatures), so keep one tree per mode
+        build_dir=f"build/optimized-{BUILD_MODE}",
+        cache=str(cache_dir),
+        force=force,
+    )
+
+
 def _build_distribution(extensions):
-    nthreads = os.cpu_count() or 1
     distribution = Distribution(
         {
             "name": "nexuscore",
-            "ext_modules": cythonize(
-                module_list=extensions,
-                compiler_directives=CYTHON_COMPILER_DIRECTIVES,
-                nthreads=nthreads,
-                build_dir="build/optimized",
-            ),
+            "ext_modules": extensions,
             "zip_safe": False,
         },
     )
@@ -174,7 +408,7 @@ def _copy_build_dir_to_project(cmd):
         relative_extension = Path(output).relative_to(cmd.build_lib)
         if not Path(output).exists():
             continue
-        shutil.copyfile(output, relative_extension)
+        _link_or_copy(output, relative_extension)
         mode = relative_extension.stat().st_mode
         mode |= (mode & 0o444) >> 2
         relative_extension.chmod(mode)
@@ -185,36 +419,179 @@ def _strip_unneeded_symbols():
     if IS_WINDOWS:
         return
     print("Stripping unneeded symbols from binaries...")
-    for so in Path("nexuscore").rglob("*.so"):
-        if IS_MACOS:
-            subprocess.run(["strip", "-x", so], check=True, capture_output=True)
-        else:
-            subprocess.run(
-                ["strip", "--strip-all", "-R", ".comment", "-R", ".note", so],
-                check=True,
-                capture_output=True,
-            )
+    sos = list(Path("nexuscore").rglob("*.so"))
+    if not sos:
+        return
+    # `strip` accepts many files, so a single process amortizes its startup
+    if IS_MACOS:
+        subprocess.run(["strip", "-x", *sos], check=True, capture_output=True)
+    else:
+        subprocess.run(
+            ["strip", "--strip-all", "-R", ".comment", "-R", ".note", *sos],
+            check=True,
+            capture_output=True,
+        )
 
 
-def build():
-    _build_rust_libs()
-    _copy_rust_dylibs()
+################################################################################
+#  BUILD STAMP
+################################################################################
+
+BUILD_STAMP_PATH = Path("build/.build_stamp")
+BUILD_INPUT_MANIFEST_PATHS = {
+    "nexuscore": Path("build/nexuscore_inputs_manifest.json"),
+    "crates": Path("build/crates_inputs_manifest.json"),
+}
+BUILD_INPUT_SUFFIXES = (".pyx", ".pxd", ".pxi", ".h", ".rs", ".toml")
+BUILD_INPUT_FILES = ("nexuscore_build.py", "Cargo.toml", "Cargo.lock", "rust-toolchain.toml")
+BUILD_ENV_VARS = (
+    "BUILD_MODE",
+    "NATIVE_ARCH",
+    "CC",
+    "CXX",
+    "LDSHARED",
+    "CFLAGS",
+    "LDFLAGS",
+    "CARGO_TARGET_DIR",
+    *RUST_ENV_VARS,
+)
+
+
+def _build_inputs():
+    # Cached listings mean an up-to-date check only stats the known inputs
+    for root, manifest_path in BUILD_INPUT_MANIFEST_PATHS.items():
+        yield from _list_files(root, BUILD_INPUT_SUFFIXES, manifest_path)
+    yield from (path for path in BUILD_INPUT_FILES if os.path.exists(path))
+
+
+def _compute_config_digest():
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{sys.version}|{cython_version}|{np.__version__}".encode())
+    for var in BUILD_ENV_VARS:
+        digest.update(f"|{var}={os.environ.get(var, '')}".encode())
+    return digest.hexdigest()
 
-    extensions = _build_extensions()
-    distribution = _build_distribution(extensions)
 
-    print("Compiling C extension modules...")
-    cmd = build_ext(distribution)
-    cmd.parallel = os.cpu_count()
-    cmd.ensure_finalized()
-    cmd.run()
+def _compute_inputs_digest():
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(_build_inputs()):
+        stat = os.stat(path)
+        digest.update(f"|{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()
 
+
+def _compute_build_stamp():
+    return f"{_compute_config_digest()}-{_compute_inputs_digest()}"
+
+
+def _read_build_stamp():
+    try:
+        return BUILD_STAMP_PATH.read_text()
+    except FileNotFoundError:
+        return ""
+
+
+def _build_outputs_exist():
+    ext_suffix = sysconfig.get_config_var("EXT_SUFFIX")
+    outputs = [Path(str(pyx)[:-4] + ext_suffix) for pyx in _find_pyx_files()]
+    outputs.append(Path("nexuscore") / f"_nexuscore_pyo3{ext_suffix}")
+    return all(output.exists() for output in outputs)
+
+
+def _build_all(pgo_stage=None, force=False):
+    # The static libs must come first: their build scripts regenerate the
+    # .pxd/.h bindings which Cython and the C compiler consume
+    _build_rust_libs(force)
+
+    extensions = _build_extensions(pgo_stage)
+
+    # The PyO3 cdylib is not linked into the C extensions, so build it concurrently
+    # in a child process (no Python thread is alive when cythonize forks its workers)
+    pyo3_process = _start_rust_pyo3_build(force)
+    try:
+        extensions = _cythonize_extensions(extensions, force)
+        distribution = _build_distribution(extensions)
+
+        print("Compiling C extension modules...")
+        cmd = build_ext(distribution)
+        cmd.parallel = min(os.cpu_count() or 1, max(len(extensions), 1))
+        # Each PGO stage compiles the same sources with different flags
+        cmd.force = force or pgo_stage is not None
+        cmd.ensure_finalized()
+        cmd.run()
+    except BaseException:
+        if pyo3_process is not None:
+            pyo3_process.terminate()
+            pyo3_process.wait()
+        raise
+
+    _wait_rust_pyo3_build(pyo3_process)
+
+    _copy_rust_dylibs()
     _copy_build_dir_to_project(cmd)
 
-    if BUILD_MODE == "release" and not IS_WINDOWS:
+    if IS_RELEASE and not IS_WINDOWS:
         _strip_unneeded_symbols()
 
 
+def _merge_llvm_profiles():
+    profraws = [str(path) for path in PGO_DIR.glob("*.profraw")]
+    llvm_profdata = ["xcrun", "llvm-profdata"] if IS_MACOS else ["llvm-profdata"]
+    subprocess.run(
+        [*llvm_profdata, "merge", f"--output={PGO_PROFDATA_PATH}", *profraws],
+        check=True,
+    )
+
+
+def _build_pgo(force=False):
+    # Instrumented objects are left in the build tree if a stage fails; dropping the stamp
+    # makes the next build of any mode rebuild everything rather than reuse them
+    BUILD_STAMP_PATH.unlink(missing_ok=True)
+    shutil.rmtree(PGO_DIR, ignore_errors=True)
+
+    print("PGO stage 1: building instrumented extension modules...")
+    _build_all(pgo_stage="generate", force=force)
+
+    print("PGO stage 1: collecting profiles from the test suite...")
+    # Profiles are written on exit whatever the test outcome, so failures do not abort
+    result = subprocess.run([sys.executable, "-m", "pytest", "-q", "tests/"], check=False)
+    if result.returncode != 0:
+        print(f"Profiling test run exited with code {result.returncode}")
+    if not any(itertools.chain(PGO_DIR.rglob("*.gcda"), PGO_DIR.rglob("*.profraw"))):
+        raise RuntimeError(
+            f"PGO profiling run wrote no profiles to {PGO_DIR}; "
+            "check that pytest is installed in the build environment and the tests ran",
+        )
+    if _is_clang():
+        _merge_llvm_profiles()
+
+    print("PGO stage 2: building profile-optimized extension modules...")
+    _build_all(pgo_stage="use")
+
+
+def build():
+    previous_stamp = _read_build_stamp()
+    stamp = _compute_build_stamp()
+    if previous_stamp == stamp and _build_outputs_exist():
+        print("All extension modules are up to date")
+        return
+
+    # A changed configuration leaves every source untouched, so the mtime checks in
+    # cargo gating, cythonize and build_ext would otherwise keep the stale outputs
+    force = previous_stamp.split("-")[0] != stamp.split("-")[0]
+    if force:
+        print("Build configuration changed, rebuilding all extension modules")
+
+    if BUILD_MODE == "pgo" and not IS_WINDOWS:
+        _build_pgo(force)
+    else:
+        _build_all(force=force)
+
+    # Stamp after building since the Rust build scripts rewrite the generated bindings
+    BUILD_STAMP_PATH.parent.mkdir(parents=True, exist_ok=True)
+    BUILD_STAMP_PATH.write_text(_compute_build_stamp())
+
+
 if __name__ == "__main__":
     print(f"System: {platform.system()} {platform.machine()}")
     print(f"Python: {platform.python_version()} ({sys.executable})")
@@ -1,6 +1,6 @@
 from setuptools import setup, Distribution
 from setuptools.command.build_py import build_py as _build_py
-import subprocess
+import os
 import sys
 
 
@@ -13,7 +13,10 @@ class BinaryDistribution(Distribution):
 class BuildPyCommand(_build_py):
     """Custom build command that runs nexuscore_build.py first."""
     def run(self):
-        subprocess.check_call([sys.executable, 'nexuscore_build.py'])
+        # Build in-process to avoid starting (and re-importing Cython/NumPy in) a new interpreter
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        import nexuscore_build
+        nexuscore_build.build()
         super().run()
 
 
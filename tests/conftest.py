@@ -1,14 +1,31 @@
 import pytest
 
+from nexuscore import LiveClock
 from nexuscore import TestClock
 from nexuscore import TraderId
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def clock():
     return TestClock()
 
 
+@pytest.fixture(scope="session")
+def live_clock():
+    return LiveClock()
+
+
+def reset_clock(clock):
+    clock.cancel_timers()
+    clock.set_time(0)
+
+
+@pytest.fixture(autouse=True)
+def _reset_clock(clock):
+    yield
+    reset_clock(clock)
+
+
 @pytest.fixture
 def trader_id():
     return TraderId("TRADER-001")
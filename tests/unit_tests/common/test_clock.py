@@ -13,10 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import threading
 import time
 from datetime import datetime
 from datetime import timedelta
 
+import numpy as np
 import pytest
 from datetime import timezone
 from zoneinfo import ZoneInfo
@@ -25,82 +27,55 @@ from nexuscore import LiveClock, TimeEvent
 
 
 class TestLiveClock:
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, live_clock):
         # Fixture Setup
         self.handler = []
-        self.clock = LiveClock()
-        self.clock.register_default_handler(self.handler.append)
-
-    def teardown_method(self):
+        self.handler_condition = threading.Condition()
+        self.clock = live_clock
+        self.clock.register_default_handler(self.handle)
+        yield
         self.clock.cancel_timers()
 
+    def handle(self, event):
+        with self.handler_condition:
+            self.handler.append(event)
+            self.handler_condition.notify_all()
+
+    def wait_for_events(self, count, timeout=2.0):
+        with self.handler_condition:
+            self.handler_condition.wait_for(lambda: len(self.handler) >= count, timeout)
+
+    def wait_for_timers_expired(self, timeout=2.0):
+        # Timers are flagged expired just after their final event is handled
+        deadline = time.monotonic() + timeout
+        while self.clock.timer_count > 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
     def test_instantiated_clock(self):
         # Arrange, Act, Assert
         assert self.clock.timer_count == 0
 
-    def test_timestamp_is_monotonic(self):
-        # Arrange, Act
-        result1 = self.clock.timestamp()
-        result2 = self.clock.timestamp()
-        result3 = self.clock.timestamp()
-        result4 = self.clock.timestamp()
-        result5 = self.clock.timestamp()
-
-        # Assert
-        assert isinstance(result1, float)
-        assert result1 > 0.0
-        assert result5 >= result4
-        assert result4 >= result3
-        assert result3 >= result2
-        assert result2 >= result1
-
-    def test_timestamp_ms_is_monotonic(self):
-        # Arrange, Act
-        result1 = self.clock.timestamp_ms()
-        result2 = self.clock.timestamp_ms()
-        result3 = self.clock.timestamp_ms()
-        result4 = self.clock.timestamp_ms()
-        result5 = self.clock.timestamp_ms()
-
-        # Assert
-        assert isinstance(result1, int)
-        assert result1 > 0
-        assert result5 >= result4
-        assert result4 >= result3
-        assert result3 >= result2
-        assert result2 >= result1
-
-    def test_timestamp_us_is_monotonic(self):
-        # Arrange, Act
-        result1 = self.clock.timestamp_us()
-        result2 = self.clock.timestamp_us()
-        result3 = self.clock.timestamp_us()
-        result4 = self.clock.timestamp_us()
-        result5 = self.clock.timestamp_us()
+    @pytest.mark.parametrize(
+        ("method", "dtype"),
+        [
+            ("timestamp", float),
+            ("timestamp_ms", int),
+            ("timestamp_us", int),
+            ("timestamp_ns", int),
+        ],
+    )
+    def test_timestamp_is_monotonic(self, method, dtype):
+        # Arrange
+        timestamp = getattr(self.clock, method)
 
-        # Assert
-        assert isinstance(result1, int)
-        assert result1 > 0
-        assert result5 >= result4
-        assert result4 >= result3
-        assert result3 >= result2
-        assert result2 >= result1
-
-    def test_timestamp_ns_is_monotonic(self):
-        # Arrange, Act
-        result1 = self.clock.timestamp_ns()
-        result2 = self.clock.timestamp_ns()
-        result3 = self.clock.timestamp_ns()
-        result4 = self.clock.timestamp_ns()
-        result5 = self.clock.timestamp_ns()
+        # Act
+        results = [timestamp() for _ in range(5)]
 
         # Assert
-        assert isinstance(result1, int)
-        assert result1 > 0
-        assert result5 >= result4
-        assert result4 >= result3
-        assert result3 >= result2
-        assert result2 >= result1
+        assert isinstance(results[0], dtype)
+        assert results[0] > 0
+        assert np.all(np.diff(np.array(results)) >= 0)
 
     def test_utc_now(self):
         # Arrange, Act
@@ -126,7 +101,8 @@ class TestLiveClock:
 
         # Act - will fire immediately
         self.clock.set_time_alert(name, alert_time)
-        time.sleep(1.0)
+        self.wait_for_events(1)
+        time.sleep(0.2)  # Allow any duplicate firing to arrive
 
         # Assert
         assert len(self.handler) == 1
@@ -140,7 +116,8 @@ class TestLiveClock:
 
         # Act
         self.clock.set_time_alert(name, alert_time)
-        time.sleep(1.0)
+        self.wait_for_events(1)
+        time.sleep(0.2)  # Allow any duplicate firing to arrive
 
         # Assert
         assert len(self.handler) == 1
@@ -169,7 +146,8 @@ class TestLiveClock:
         # Act
         self.clock.set_time_alert("TEST_ALERT1", alert_time1)
         self.clock.set_time_alert("TEST_ALERT2", alert_time2)
-        time.sleep(2.0)
+        self.wait_for_events(2)
+        self.wait_for_timers_expired()
 
         # Assert
         assert self.clock.timer_count == 0
@@ -189,7 +167,7 @@ class TestLiveClock:
             stop_time=None,
         )
 
-        time.sleep(2.0)
+        self.wait_for_events(1)
 
         # Assert
         assert self.clock.timer_names == [name]
@@ -209,7 +187,7 @@ class TestLiveClock:
             stop_time=None,
         )
 
-        time.sleep(2.0)
+        self.wait_for_events(1)
 
         # Assert
         assert self.clock.timer_names == [name]
@@ -231,7 +209,8 @@ class TestLiveClock:
             stop_time=stop_time,
         )
 
-        time.sleep(2.0)
+        self.wait_for_events(1)
+        self.wait_for_timers_expired()
 
         # Assert
         assert self.clock.timer_count == 0
@@ -246,13 +225,14 @@ class TestLiveClock:
         self.clock.set_timer(name=name, interval=interval)
 
         # Act
-        time.sleep(0.3)
+        self.wait_for_events(1)
         self.clock.cancel_timer(name)
-        time.sleep(1.0)
+        count = len(self.handler)
+        time.sleep(0.3)
 
-        # Assert
+        # Assert - at most one tick already in flight when cancelled
         assert self.clock.timer_count == 0
-        assert len(self.handler) <= 6
+        assert len(self.handler) <= count + 1
 
     def test_set_repeating_timer(self):
         # Arrange
@@ -268,7 +248,7 @@ class TestLiveClock:
             stop_time=None,
         )
 
-        time.sleep(2.0)
+        self.wait_for_events(1)
 
         # Assert
         assert len(self.handler) > 0
@@ -289,12 +269,13 @@ class TestLiveClock:
         )
 
         # Act
-        time.sleep(0.3)
+        self.wait_for_events(1)
         self.clock.cancel_timer(name)
-        time.sleep(1.0)
+        count = len(self.handler)
+        time.sleep(0.3)
 
-        # Assert
-        assert len(self.handler) <= 6
+        # Assert - at most one tick already in flight when cancelled
+        assert len(self.handler) <= count + 1
 
     def test_set_two_repeating_timers(self):
         # Arrange
@@ -316,7 +297,7 @@ class TestLiveClock:
             stop_time=None,
         )
 
-        time.sleep(1.0)
+        self.wait_for_events(2)
 
         # Assert
         assert len(self.handler) >= 2